@@ -0,0 +1,24 @@
+"""
+In-process cache for parsed YAML files
+
+load_yaml is memoized on (path, mtime_ns), so repeat loads of an
+unchanged file within one process are a cache hit instead of a re-parse.
+Callers pass the file's mtime themselves; a changed file produces a new
+key and naturally falls through to a fresh parse.
+"""
+
+import yaml
+from functools import lru_cache
+
+# Prefer the libyaml C loader when available (~10x faster YAML parse)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+@lru_cache(maxsize=16)
+def load_yaml(path: str, mtime_ns: int):
+    """Parse a YAML file, memoized on (path, mtime_ns)"""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
@@ -1,20 +1,70 @@
 import os
-import yaml
+import pickle
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from ._yaml_cache import load_yaml
+except ImportError:
+    # fallback if running as script
+    from _yaml_cache import load_yaml
+
 # Backend configuration for multi-provider LLM integration
 
 # Load config from YAML file
 CONFIG_FILE = Path(__file__).parent / "config.yaml"
+# Pickle cache of the parsed config, keyed by (mtime_ns, size) of config.yaml.
+# Skips the YAML parse entirely on restarts when the file hasn't changed.
+CONFIG_CACHE_FILE = CONFIG_FILE.with_suffix('.yaml.pkl')
 config_data = {}
 
+
+def _load_config_cached(config_file):
+    """Load config.yaml, using the pickle cache when it is still fresh"""
+    stat = config_file.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    # Fast path: cached parse from a previous run
+    try:
+        with open(CONFIG_CACHE_FILE, 'rb') as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == key:
+            return cached_data
+    except Exception:
+        pass  # missing/stale/corrupt cache - fall through to a full parse
+
+    data = load_yaml(str(config_file), stat.st_mtime_ns) or {}
+
+    # Write the cache atomically (tmp + rename) so a crash never leaves
+    # a half-written pickle behind; cache failures are non-fatal.
+    try:
+        tmp_file = CONFIG_CACHE_FILE.with_suffix('.pkl.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((key, data), f)
+        os.replace(tmp_file, CONFIG_CACHE_FILE)
+    except Exception:
+        pass
+
+    return data
+
+
 if CONFIG_FILE.exists():
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = _load_config_cached(CONFIG_FILE)
     except Exception as e:
         print(f"Warning: Could not load config.yaml: {e}")
 
+@lru_cache(maxsize=None)
+def _env(name, default=None):
+    """Read an environment variable once and cache it.
+
+    All env reads below happen at import and are bound to module
+    constants; any later per-request caller should go through this
+    helper so repeat reads are a cache hit, not a getenv call.
+    """
+    return os.getenv(name, default)
+
+
 # LLM Configuration - All providers
 LLM_CONFIG = config_data.get('llm', {})
 ACTIVE_PROVIDER = LLM_CONFIG.get('provider', 'openai')
@@ -22,7 +72,7 @@ FALLBACK_TO_RULES = LLM_CONFIG.get('fallback_to_rules', True)
 
 # OpenAI Configuration (priority: config.yaml > env vars > defaults)
 OPENAI_CONFIG = config_data.get('openai', {})
-OPENAI_API_KEY = OPENAI_CONFIG.get('api_key') or os.getenv('OPENAI_API_KEY')
+OPENAI_API_KEY = OPENAI_CONFIG.get('api_key') or _env('OPENAI_API_KEY')
 OPENAI_MODEL = OPENAI_CONFIG.get('model', 'gpt-4o-mini-2024-07-18')
 OPENAI_TEMPERATURE = OPENAI_CONFIG.get('temperature', 1.0)
 OPENAI_MAX_TOKENS = OPENAI_CONFIG.get('max_tokens', 2048)
@@ -43,31 +43,33 @@ CORS_CONFIG = DEVELOPMENT_CORS if ENV == 'development' else PRODUCTION_CORS
 # Additional CORS settings
 MAX_AGE = 3600  # Preflight request cache time in seconds
 
+# Precomputed origin lookup structures so per-request checks are O(1)
+_ALLOW_ALL = CORS_CONFIG["allow_origins"] == ["*"]
+_ALLOWED_SET = frozenset(CORS_CONFIG["allow_origins"])
+
+# Full config with max_age folded in, built once at import
+_CORS_CONFIG_FULL = dict(CORS_CONFIG, max_age=MAX_AGE)
+
 def get_cors_config():
     """
     Get CORS configuration based on environment
-    
+
     Returns:
         dict: CORS configuration dictionary
     """
-    config = CORS_CONFIG.copy()
-    config["max_age"] = MAX_AGE
-    return config
+    return _CORS_CONFIG_FULL
 
 def is_origin_allowed(origin: str) -> bool:
     """
     Check if an origin is allowed
-    
+
     Args:
         origin (str): Origin URL to check
-        
+
     Returns:
         bool: True if origin is allowed, False otherwise
     """
-    if CORS_CONFIG["allow_origins"] == ["*"]:
-        return True
-    
-    return origin in CORS_CONFIG["allow_origins"]
+    return _ALLOW_ALL or origin in _ALLOWED_SET
 
 # Print current CORS configuration on import
 if __name__ != "__main__":
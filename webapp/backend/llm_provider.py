@@ -5,29 +5,85 @@ Supports multiple LLM providers: OpenAI, Ollama, vLLM, Anthropic
 
 import logging
 import json
+import time
 import requests
-from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+# Use orjson for JSON encode/decode when available (2-4x faster than stdlib)
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 logger = logging.getLogger("llm_provider")
 
+# requests' json= kwarg would re-encode with stdlib json; send pre-encoded
+# bytes with an explicit content type instead
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared HTTP session for the local providers (Ollama/vLLM) so connections
+# are pooled and kept alive instead of re-handshaking per request
+_SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+
+class LLMProvider:
+    """Base class for LLM providers.
+
+    Subclasses must implement generate() and _check_available(). A plain
+    base class is used instead of an ABC on purpose: nothing isinstance-
+    checks against it, and skipping ABCMeta avoids its metaclass overhead
+    on instantiation and method lookup.
+    """
+
+    __slots__ = ('config', '_avail_cache')
+
+    # How long an availability result stays valid. HTTP-probing providers
+    # (Ollama/vLLM) use the short default so a server coming up is noticed
+    # quickly; API-key providers override with a long TTL since their check
+    # is a pure config lookup.
+    _avail_ttl = 5.0
 
-class LLMProvider(ABC):
-    """Abstract base class for LLM providers"""
-    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-    
-    @abstractmethod
+        self._avail_cache = None  # (timestamp, result) once checked
+
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text from the LLM"""
-        pass
-    
-    @abstractmethod
+        raise NotImplementedError
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None):
+        """Yield response text incrementally as it arrives.
+
+        Providers that support server-side streaming override this; the
+        default yields the full completion as a single chunk.
+        """
+        yield self.generate(prompt, system_prompt)
+
+    def _check_available(self) -> bool:
+        """Provider-specific availability check (may hit the network)"""
+        raise NotImplementedError
+
     def is_available(self) -> bool:
-        """Check if the provider is available/configured"""
-        pass
-    
+        """Check if the provider is available, caching the result for a TTL"""
+        cached = self._avail_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._avail_ttl:
+            return cached[1]
+        available = self._check_available()
+        self._avail_cache = (now, available)
+        return available
+
     def get_provider_name(self) -> str:
         """Get the name of the provider"""
         return self.__class__.__name__.replace("Provider", "")
@@ -35,34 +91,59 @@ class LLMProvider(ABC):
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT Provider"""
-    
-    def is_available(self) -> bool:
+
+    __slots__ = ('_client',)
+
+    _openai_cls = None  # lazily imported openai.OpenAI class, cached after first use
+    _avail_ttl = 300.0  # key check is a dict lookup, no need to repeat often
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self._client = None
+
+    def _check_available(self) -> bool:
         return bool(self.config.get('api_key'))
-    
+
+    def _get_client(self):
+        """Import the SDK and build the client once, then reuse it"""
+        if self._client is None:
+            if OpenAIProvider._openai_cls is None:
+                from openai import OpenAI
+                OpenAIProvider._openai_cls = OpenAI
+            self._client = OpenAIProvider._openai_cls(api_key=self.config['api_key'])
+        return self._client
+
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        return "".join(self.generate_stream(prompt, system_prompt)).strip()
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None):
         try:
-            from openai import OpenAI
-            
             if not self.is_available():
                 raise ValueError("OpenAI API key not configured")
-            
-            client = OpenAI(api_key=self.config['api_key'])
-            
-            messages = []
+
+            client = self._get_client()
+
+            # Common case is no system prompt: build the list in one
+            # literal instead of conditional appends
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            response = client.chat.completions.create(
+                messages = [{"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt}]
+            else:
+                messages = [{"role": "user", "content": prompt}]
+
+            stream = client.chat.completions.create(
                 model=self.config.get('model', 'gpt-4o-mini-2024-07-18'),
                 messages=messages,
                 max_tokens=self.config.get('max_tokens', 2048),
                 temperature=self.config.get('temperature', 1.0),
-                top_p=self.config.get('top_p', 1.0)
+                top_p=self.config.get('top_p', 1.0),
+                stream=True
             )
-            
-            return response.choices[0].message.content.strip()
-            
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
         except Exception as e:
             logger.error(f"OpenAI generation failed: {e}")
             raise
@@ -70,42 +151,71 @@ class OpenAIProvider(LLMProvider):
 
 class OllamaProvider(LLMProvider):
     """Ollama Local LLM Provider"""
-    
-    def is_available(self) -> bool:
+
+    __slots__ = ('_api_url', '_payload_template', '_tags_url')
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        explicit_url = config.get('api_url')
+        self._api_url = explicit_url or 'http://localhost:11434/api/chat'
+        # Probe URL derived once. With no server configured, probing the
+        # default localhost URL is opt-in via 'autodetect: true'; a None
+        # here means availability checks skip the network entirely.
+        if explicit_url or config.get('autodetect', False):
+            self._tags_url = self._api_url.rsplit('/api/', 1)[0] + '/api/tags'
+        else:
+            self._tags_url = None
+        # Static request fields resolved once; generate_stream copies the
+        # template and just stamps the messages in
+        self._payload_template = {
+            "model": config.get('model', 'mistral:latest'),
+            "stream": True,
+            "options": {
+                "temperature": config.get('temperature', 0.7),
+                "num_predict": config.get('max_tokens', 2048)
+            }
+        }
+
+    def _check_available(self) -> bool:
         # Check if Ollama server is reachable
+        if self._tags_url is None:
+            return False
         try:
-            api_url = self.config.get('api_url', 'http://localhost:11434/api/chat')
-            base_url = api_url.rsplit('/api/', 1)[0]
-            response = requests.get(f"{base_url}/api/tags", timeout=2)
+            response = _SESSION.get(self._tags_url, timeout=2)
             return response.status_code == 200
         except:
             return False
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        return "".join(self.generate_stream(prompt, system_prompt)).strip()
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None):
         try:
-            api_url = self.config.get('api_url', 'http://localhost:11434/api/chat')
-            
-            messages = []
+            # Common case is no system prompt: build the list in one
+            # literal instead of conditional appends
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            payload = {
-                "model": self.config.get('model', 'mistral:latest'),
-                "messages": messages,
-                "stream": self.config.get('stream', False),
-                "options": {
-                    "temperature": self.config.get('temperature', 0.7),
-                    "num_predict": self.config.get('max_tokens', 2048)
-                }
-            }
-            
-            response = requests.post(api_url, json=payload, timeout=30)
+                messages = [{"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt}]
+            else:
+                messages = [{"role": "user", "content": prompt}]
+
+            payload = self._payload_template.copy()
+            payload["messages"] = messages
+
+            response = _SESSION.post(self._api_url, data=_dumps(payload), headers=_JSON_HEADERS, timeout=30, stream=True)
             response.raise_for_status()
-            
-            result = response.json()
-            return result['message']['content'].strip()
-            
+
+            # Ollama streams one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _loads(line)
+                piece = chunk.get('message', {}).get('content', '')
+                if piece:
+                    yield piece
+                if chunk.get('done'):
+                    break
+
         except Exception as e:
             logger.error(f"Ollama generation failed: {e}")
             raise
@@ -113,22 +223,39 @@ class OllamaProvider(LLMProvider):
 
 class VLLMProvider(LLMProvider):
     """vLLM OpenAI-compatible Provider"""
-    
-    def is_available(self) -> bool:
+
+    __slots__ = ('_api_url', '_payload_template', '_health_url')
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self._api_url = config.get('api_url')
+        # Health-check URL derived from the chat endpoint once
+        self._health_url = (
+            self._api_url.rsplit('/v1/', 1)[0] + '/health' if self._api_url else None
+        )
+        # Static request fields resolved once; generate_stream copies the
+        # template and just stamps the messages in
+        self._payload_template = {
+            "model": config.get('model', '/models'),
+            "max_tokens": config.get('max_tokens', 2048),
+            "temperature": config.get('temperature', 0.7),
+            "top_p": config.get('top_p', 1.0),
+            "stream": True
+        }
+
+    def _check_available(self) -> bool:
         # Check if vLLM server is reachable
+        if not self._api_url:
+            return False
         try:
-            api_url = self.config.get('api_url', '')
-            if not api_url:
-                return False
             # Try to reach the server
-            response = requests.get(api_url.rsplit('/v1/', 1)[0] + '/health', timeout=2)
+            response = _SESSION.get(self._health_url, timeout=2)
             return response.status_code == 200
         except:
             # If health endpoint doesn't exist, try a simple request
             try:
-                api_url = self.config.get('api_url', '')
-                response = requests.post(
-                    api_url,
+                response = _SESSION.post(
+                    self._api_url,
                     json={
                         "model": self.config.get('model', '/models'),
                         "messages": [{"role": "user", "content": "test"}],
@@ -141,31 +268,41 @@ class VLLMProvider(LLMProvider):
                 return False
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+        return "".join(self.generate_stream(prompt, system_prompt)).strip()
+
+    def generate_stream(self, prompt: str, system_prompt: Optional[str] = None):
         try:
-            api_url = self.config.get('api_url')
-            
-            if not api_url:
+            if not self._api_url:
                 raise ValueError("vLLM API URL not configured")
-            
-            messages = []
+
+            # Common case is no system prompt: build the list in one
+            # literal instead of conditional appends
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            payload = {
-                "model": self.config.get('model', '/models'),
-                "messages": messages,
-                "max_tokens": self.config.get('max_tokens', 2048),
-                "temperature": self.config.get('temperature', 0.7),
-                "top_p": self.config.get('top_p', 1.0)
-            }
-            
-            response = requests.post(api_url, json=payload, timeout=30)
+                messages = [{"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt}]
+            else:
+                messages = [{"role": "user", "content": prompt}]
+
+            payload = self._payload_template.copy()
+            payload["messages"] = messages
+
+            response = _SESSION.post(self._api_url, data=_dumps(payload), headers=_JSON_HEADERS, timeout=30, stream=True)
             response.raise_for_status()
-            
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip()
-            
+
+            # OpenAI-compatible SSE stream: "data: {...}" lines, [DONE] sentinel
+            for line in response.iter_lines():
+                if not line or not line.startswith(b"data: "):
+                    continue
+                data = line[len(b"data: "):]
+                if data == b"[DONE]":
+                    break
+                chunk = _loads(data)
+                choices = chunk.get('choices')
+                if choices:
+                    piece = choices[0].get('delta', {}).get('content')
+                    if piece:
+                        yield piece
+
         except Exception as e:
             logger.error(f"vLLM generation failed: {e}")
             raise
@@ -173,19 +310,35 @@ class VLLMProvider(LLMProvider):
 
 class AnthropicProvider(LLMProvider):
     """Anthropic Claude Provider"""
-    
-    def is_available(self) -> bool:
+
+    __slots__ = ('_client',)
+
+    _anthropic_mod = None  # lazily imported anthropic module, cached after first use
+    _avail_ttl = 300.0  # key check is a dict lookup, no need to repeat often
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self._client = None
+
+    def _check_available(self) -> bool:
         return bool(self.config.get('api_key'))
-    
+
+    def _get_client(self):
+        """Import the SDK and build the client once, then reuse it"""
+        if self._client is None:
+            if AnthropicProvider._anthropic_mod is None:
+                import anthropic
+                AnthropicProvider._anthropic_mod = anthropic
+            self._client = AnthropicProvider._anthropic_mod.Anthropic(api_key=self.config['api_key'])
+        return self._client
+
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         try:
-            import anthropic
-            
             if not self.is_available():
                 raise ValueError("Anthropic API key not configured")
-            
-            client = anthropic.Anthropic(api_key=self.config['api_key'])
-            
+
+            client = self._get_client()
+
             # Anthropic uses system parameter separately
             kwargs = {
                 "model": self.config.get('model', 'claude-3-5-sonnet-20241022'),
@@ -206,31 +359,54 @@ class AnthropicProvider(LLMProvider):
             raise
 
 
+# Static provider registry, built once at import; each manager just maps
+# its config sections through it
+_PROVIDER_CLASSES = (
+    ('openai', OpenAIProvider),
+    ('ollama', OllamaProvider),
+    ('vllm', VLLMProvider),
+    ('anthropic', AnthropicProvider),
+)
+
+
 class LLMProviderManager:
     """Manages multiple LLM providers and handles switching"""
-    
+
+    __slots__ = ('config', 'providers', 'active_provider_name',
+                 'fallback_to_rules', '_probe_pool', '_active',
+                 '_active_generate')
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.providers = {
-            'openai': OpenAIProvider(config.get('openai', {})),
-            'ollama': OllamaProvider(config.get('ollama', {})),
-            'vllm': VLLMProvider(config.get('vllm', {})),
-            'anthropic': AnthropicProvider(config.get('anthropic', {}))
+            name: cls(config.get(name, {})) for name, cls in _PROVIDER_CLASSES
         }
         
         # Get active provider from config
         llm_config = config.get('llm', {})
         self.active_provider_name = llm_config.get('provider', 'openai')
         self.fallback_to_rules = llm_config.get('fallback_to_rules', True)
-        
+
+        # Reused pool for fanning out availability probes; the Ollama/vLLM
+        # checks can each block up to 2s, so run them in parallel
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=len(self.providers), thread_name_prefix="llm-probe"
+        )
+
+        # Validate the configured provider name here, once, rather than on
+        # every generate call; set_active_provider re-validates on switch.
+        # Bind the provider and its generate method so the per-request hot
+        # path is a couple of attribute loads.
+        if self.active_provider_name not in self.providers:
+            raise ValueError(f"Unknown provider: {self.active_provider_name}")
+        self._active = self.providers[self.active_provider_name]
+        self._active_generate = self._active.generate
+
         logger.info(f"LLM Provider Manager initialized with active provider: {self.active_provider_name}")
     
     def get_active_provider(self) -> LLMProvider:
         """Get the currently active provider"""
-        provider = self.providers.get(self.active_provider_name)
-        if not provider:
-            raise ValueError(f"Unknown provider: {self.active_provider_name}")
-        return provider
+        return self._active
     
     def set_active_provider(self, provider_name: str) -> bool:
         """Switch to a different provider"""
@@ -244,14 +420,22 @@ class LLMProviderManager:
             return False
         
         self.active_provider_name = provider_name
+        self._active = provider
+        self._active_generate = provider.generate
         logger.info(f"Switched to provider: {provider_name}")
         return True
     
     def get_available_providers(self) -> List[Dict[str, Any]]:
         """Get list of all providers with their availability status"""
+        # Probe all providers concurrently; results come back in the
+        # original provider order since we key futures by name
+        futures = {
+            name: self._probe_pool.submit(provider.is_available)
+            for name, provider in self.providers.items()
+        }
         result = []
         for name, provider in self.providers.items():
-            available = provider.is_available()
+            available = futures[name].result()
             result.append({
                 "name": name,
                 "available": available,
@@ -265,12 +449,11 @@ class LLMProviderManager:
     
     def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         """Generate text using the active provider"""
-        provider = self.get_active_provider()
-        
+        provider = self._active
         if not provider.is_available():
             raise RuntimeError(f"Active provider {self.active_provider_name} is not available")
-        
-        return provider.generate(prompt, system_prompt)
+
+        return self._active_generate(prompt, system_prompt)
     
     def should_fallback_to_rules(self) -> bool:
         """Check if should fallback to rule-based parsing on error"""
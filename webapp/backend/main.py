@@ -1,12 +1,50 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
+import bisect
+import difflib
+import hashlib
 import json
+import math
+import mmap
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
 import logging
 
+# Use orjson for JSON parse/serialize when available (3-5x faster than
+# stdlib on typical GeoJSON)
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+# Endpoints that return plain dicts get orjson encoding too; the class
+# import always succeeds but it only renders when orjson is installed.
+if _loads is json.loads:
+    _default_response_class = JSONResponse
+else:
+    from fastapi.responses import ORJSONResponse as _default_response_class
+
+# RapidFuzz (C++ bit-parallel Levenshtein) for the fuzzy search fallback
+# when available; difflib covers the same path otherwise.
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_process = None
+
 try:
     from .config import (
         ALLOWED_ORIGINS, ACTIONS, config_data,
@@ -28,7 +66,8 @@ logging.basicConfig(level=logging.INFO)
 llm_manager = LLMProviderManager(config_data)
 logger.info(f"🚀 LLM Provider Manager initialized - Active: {llm_manager.active_provider_name}")
 
-app = FastAPI(title="Indian Railway Stations API")
+app = FastAPI(title="Indian Railway Stations API",
+              default_response_class=_default_response_class)
 
 # Enable CORS for frontend - Allow all origins in development
 app.add_middleware(
@@ -39,10 +78,574 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (the detailed India boundary and the
+# full LOD station list dwarf their gzipped size); responses under 1 KB
+# skip the pass, and level 5 trades a little ratio for much less CPU
+# than the default level 9
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Base directory for data files
 BASE_DIR = Path(__file__).parent
 DATA_DIR = BASE_DIR / "data"
 
+# Data files discovered at startup, so per-request existence checks are
+# a set lookup instead of a stat() syscall per handler.
+_KNOWN_FILES = set(DATA_DIR.rglob("*.geojson")) | set(DATA_DIR.glob("*.json"))
+
+
+def _path_known(path):
+    """True if path is a known data file; stats only on a cache miss"""
+    if path in _KNOWN_FILES:
+        return True
+    if path.exists():
+        # Added after startup - remember it so the next check is free
+        _KNOWN_FILES.add(path)
+        return True
+    return False
+
+# Bounded, mtime-aware LRU cache of parsed GeoJSON/JSON data files.
+# The files are static in practice, so after the first load a request is
+# a dict reference; an edited file is picked up via the mtime check.
+_GEOJSON_CACHE = OrderedDict()  # Path -> (mtime_ns, data, zoom_meta)
+_GEOJSON_CACHE_MAX = 32
+_GEOJSON_CACHE_LOCK = threading.Lock()
+
+
+# Interned render_at_zoom ranges and a memoized visibility predicate.
+# Most features share a handful of distinct ranges (e.g. all landmarks
+# [8, 35]), so each (range, zoom) pair is evaluated once and then served
+# from a small dict for every feature and request that shares it.
+_RANGE_INTERN = {}
+_NEVER_RENDERED = (1.0, 0.0)  # empty interval for malformed render_at_zoom
+_ZOOM_PRED_CACHE = {}  # (range tuple, zoom_level) -> bool
+_ZOOM_PRED_CACHE_MAX = 4096
+
+
+def _range_allows(rng, zoom_level):
+    """Memoized: is a render range visible at this zoom level"""
+    key = (rng, zoom_level)
+    allowed = _ZOOM_PRED_CACHE.get(key)
+    if allowed is None:
+        allowed = rng[0] <= zoom_level <= rng[1]
+        if len(_ZOOM_PRED_CACHE) >= _ZOOM_PRED_CACHE_MAX:
+            _ZOOM_PRED_CACHE.clear()
+        _ZOOM_PRED_CACHE[key] = allowed
+    return allowed
+
+
+def _build_zoom_meta(data):
+    """Build a struct-of-arrays sidecar for zoom filtering.
+
+    For each zoom-aware list in the file, extract a parallel array of
+    interned render-range tuples plus the set of distinct ranges, so
+    per-request filtering evaluates the zoom predicate once per distinct
+    range instead of once per feature. A malformed render_at_zoom maps
+    to the empty interval so the feature is never rendered, matching the
+    original filter's behavior.
+    """
+    if not isinstance(data, dict) or 'features' not in data:
+        return None
+
+    meta = {}
+    for key in ('features', 'districts', 'cities', 'landmarks'):
+        items = data.get(key)
+        if not isinstance(items, list):
+            continue
+        ranges = []
+        for item in items:
+            render_zoom = item.get('properties', {}).get('render_at_zoom', [0, 35])
+            if isinstance(render_zoom, list) and len(render_zoom) == 2:
+                rng = (render_zoom[0], render_zoom[1])
+            else:
+                rng = _NEVER_RENDERED
+            ranges.append(_RANGE_INTERN.setdefault(rng, rng))
+        meta[key] = (ranges, frozenset(ranges), items)
+    return meta
+
+
+def _parse_json_file(path):
+    """Parse a JSON data file.
+
+    With orjson available, the file is memory-mapped and parsed straight
+    from the OS page cache, skipping the intermediate heap copy a
+    read_bytes() would make (and sharing pages across workers); the
+    stdlib parser needs a real bytes object, so it keeps the plain read.
+
+    A streaming parser (ijson-style) was considered for fullstations.json
+    but deliberately not adopted: the whole data directory is ~100 KB and
+    every parse lands in the mtime-keyed cache above, so each file is
+    materialized once per change rather than once per request. Revisit if
+    the station file ever grows to a size where holding it resident hurts.
+    """
+    if _loads is not json.loads:
+        try:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _loads(memoryview(mm))
+        except ValueError:
+            pass  # zero-length files cannot be mapped
+    return _loads(path.read_bytes())
+
+
+def _cache_entry(path):
+    """(mtime_ns, data, zoom_meta) for a JSON file, via the LRU cache"""
+    mtime = os.stat(path).st_mtime_ns
+    with _GEOJSON_CACHE_LOCK:
+        entry = _GEOJSON_CACHE.get(path)
+        if entry is not None and entry[0] == mtime:
+            _GEOJSON_CACHE.move_to_end(path)
+            return entry
+
+    data = _parse_json_file(path)
+    entry = (mtime, data, _build_zoom_meta(data))
+
+    with _GEOJSON_CACHE_LOCK:
+        _GEOJSON_CACHE[path] = entry
+        _GEOJSON_CACHE.move_to_end(path)
+        while len(_GEOJSON_CACHE) > _GEOJSON_CACHE_MAX:
+            _GEOJSON_CACHE.popitem(last=False)
+    return entry
+
+
+def _load_json_cached(path):
+    """Load a JSON file through the bounded mtime-aware LRU cache"""
+    return _cache_entry(path)[1]
+
+
+# fullstations.json backs several endpoints; load it through one place
+_FULLSTATIONS_PATH = DATA_DIR / "fullstations.json"
+
+
+def _load_stations():
+    """Parsed fullstations.json via the mtime-aware cache"""
+    return _load_json_cached(_FULLSTATIONS_PATH)
+
+
+# Struct-of-arrays view over every station, for the search endpoints
+_STATION_INDEX_CACHE = None  # (mtime_ns, index)
+_STATION_INDEX_LOCK = threading.Lock()
+
+
+def _build_station_index(data):
+    """Flatten zones -> features into parallel arrays sharing one index.
+
+    names_lower/codes_lower are the pre-lowercased search keys; the other
+    arrays carry what the endpoints serialize. Searches become one tight
+    scan with no per-request lowercasing or nested dict walking.
+    """
+    names_lower = []
+    codes_lower = []
+    props_list = []
+    zones = []
+    zone_codes = []
+    coords_list = []
+    for zone_name, zone_data in data.get('zones', {}).items():
+        zone_code = zone_data.get('zone_code')
+        for feature in zone_data.get('features', []):
+            props = feature.get('properties', {})
+            names_lower.append(props.get('name', '').lower())
+            codes_lower.append(props.get('code', '').lower())
+            props_list.append(props)
+            zones.append(zone_name)
+            zone_codes.append(zone_code)
+            coords_list.append(feature.get('geometry', {}).get('coordinates', []))
+
+    # Trigram postings: every 3-char window of each name/code maps to the
+    # record indices containing it, so substring search intersects a few
+    # short lists instead of scanning every station.
+    tri_index = {}
+    for i, name in enumerate(names_lower):
+        seen = set()
+        for text in (name, codes_lower[i]):
+            for j in range(len(text) - 2):
+                gram = text[j:j + 3]
+                if gram not in seen:
+                    seen.add(gram)
+                    tri_index.setdefault(gram, []).append(i)
+
+    # One NUL-joined blob of every name and code plus the start offset of
+    # each record's segment. Short queries (no trigrams) run a single
+    # C-level find() over this instead of a Python-level loop per record.
+    segments = []
+    segment_starts = []
+    pos = 0
+    for i, name in enumerate(names_lower):
+        segment = name + "\x00" + codes_lower[i]
+        segment_starts.append(pos)
+        segments.append(segment)
+        pos += len(segment) + 1
+    search_blob = "\x00".join(segments)
+
+    # Response-shaped records, built once per file change. The search
+    # handlers return references into these lists, so a match costs no
+    # per-request dict allocation at all. sample_records is None where a
+    # record has no usable coordinates (those never appear in results).
+    sample_records = []
+    detail_records = []
+    for i, props in enumerate(props_list):
+        coords = coords_list[i]
+        if len(coords) >= 2:
+            sample_records.append({
+                "type": "Station",
+                "name": props.get("name", "Unknown"),
+                "code": props.get("code", "N/A"),
+                "category": props.get("category", "N/A"),
+                "zone": zones[i],
+                "zone_code": zone_codes[i] if zone_codes[i] is not None else "N/A",
+                "latitude": coords[1],
+                "longitude": coords[0]
+            })
+        else:
+            sample_records.append(None)
+        detail_records.append({
+            'name': props.get('name'),
+            'code': props.get('code'),
+            'zone': zones[i],
+            'lat': props.get('lat'),
+            'lon': props.get('lon'),
+            'importance': props.get('importance')
+        })
+
+    # First-wins coordinate lookup by exact lowercased name or code, so
+    # the common "query is the station's actual name" case never scans
+    coord_by_key = {}
+    for i, name in enumerate(names_lower):
+        coords = coords_list[i]
+        if len(coords) >= 2:
+            coord = {"lat": coords[1], "lon": coords[0]}
+            coord_by_key.setdefault(name, coord)
+            if codes_lower[i]:
+                coord_by_key.setdefault(codes_lower[i], coord)
+
+    # Broad queries (one character) match nearly everything only for
+    # pagination to throw it away; they get this importance-ranked list
+    top_stations = [
+        sample_records[i]
+        for i in sorted(
+            (i for i in range(len(props_list)) if sample_records[i] is not None),
+            key=lambda i: -_IMPORTANCE_BY_CATEGORY.get(
+                props_list[i].get('category'), 3))
+    ]
+
+    return {
+        'names_lower': names_lower,
+        'codes_lower': codes_lower,
+        'props': props_list,
+        'zones': zones,
+        'zone_codes': zone_codes,
+        'coords': coords_list,
+        'tri_index': tri_index,
+        'search_blob': search_blob,
+        'segment_starts': segment_starts,
+        'sample_records': sample_records,
+        'detail_records': detail_records,
+        'coord_by_key': coord_by_key,
+        'top_stations': top_stations,
+    }
+
+
+def _search_candidates(index, query_lower):
+    """Record indices that may contain query_lower, in index order.
+
+    Queries of three or more characters intersect the trigram postings
+    (a miss on any trigram means no match at all); shorter queries fall
+    back to scanning every record. Candidates still need the final
+    substring check, since trigrams can co-occur without being adjacent.
+    """
+    if len(query_lower) < 3:
+        # Scan the joined blob with find(); the NUL sentinels cannot
+        # appear in a query, so matches never span two records.
+        blob = index['search_blob']
+        starts = index['segment_starts']
+        hits = []
+        pos = blob.find(query_lower)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            if not hits or hits[-1] != i:
+                hits.append(i)
+            pos = blob.find(query_lower, pos + 1)
+        return hits
+
+    tri_index = index['tri_index']
+    postings = []
+    for i in range(len(query_lower) - 2):
+        posting = tri_index.get(query_lower[i:i + 3])
+        if posting is None:
+            return ()
+        postings.append(posting)
+    if len(postings) == 1:
+        return postings[0]
+
+    smallest = min(postings, key=len)
+    others = [set(p) for p in postings if p is not smallest]
+    return [i for i in smallest if all(i in s for s in others)]
+
+
+def _match_stations(index, query_lower, exact_code=False):
+    """Indices of stations matching the query, in index order.
+
+    The one verification loop both search endpoints share: candidates
+    come from the trigram/blob index, each confirmed with the substring
+    check. exact_code narrows the code test to equality — the sample
+    endpoint's historical behavior — while the details endpoint also
+    matches substrings of codes.
+    """
+    names_lower = index['names_lower']
+    codes_lower = index['codes_lower']
+    if exact_code:
+        return [i for i in _search_candidates(index, query_lower)
+                if query_lower in names_lower[i]
+                or query_lower == codes_lower[i]]
+    return [i for i in _search_candidates(index, query_lower)
+            if query_lower in names_lower[i]
+            or query_lower in codes_lower[i]]
+
+
+def _fuzzy_station_hits(index, query_lower, limit):
+    """Near-miss station indices for a query with no exact substring hits.
+
+    Catches typos like "chenai" -> "chennai central". Scores against the
+    pre-lowercased names: rapidfuzz partial_ratio when installed, else
+    difflib's close-match ratio.
+    """
+    names_lower = index['names_lower']
+    if _rf_process is not None:
+        matches = _rf_process.extract(
+            query_lower, names_lower,
+            scorer=_rf_fuzz.partial_ratio, score_cutoff=80, limit=limit)
+        return [i for _, _, i in matches]
+
+    # difflib ratios full strings, so score the best word of each name to
+    # approximate partial matching ("chenai" vs "chennai central")
+    matcher = difflib.SequenceMatcher(b=query_lower)
+    scored = []
+    for i, name in enumerate(names_lower):
+        best = 0.0
+        for word in name.split():
+            matcher.set_seq1(word)
+            ratio = matcher.ratio()
+            if ratio > best:
+                best = ratio
+        if best >= 0.75:
+            scored.append((best, i))
+    scored.sort(key=lambda pair: -pair[0])
+    return [i for _, i in scored[:limit]]
+
+
+def _station_index():
+    """SoA station index, rebuilt only when fullstations.json changes"""
+    global _STATION_INDEX_CACHE
+    mtime = _cache_entry(_FULLSTATIONS_PATH)[0]
+    cached = _STATION_INDEX_CACHE
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    index = _build_station_index(_load_stations())
+    with _STATION_INDEX_LOCK:
+        _STATION_INDEX_CACHE = (mtime, index)
+    return index
+
+
+# Level-filtered station lists for the LOD endpoint, keyed by file mtime
+_LOD_CACHE = None  # (mtime_ns, {level: stations})
+_LOD_CACHE_LOCK = threading.Lock()
+
+# Importance score per station category and the zonal headquarters codes
+# that make up LOD level 0
+_IMPORTANCE_BY_CATEGORY = {'A1': 5, 'A': 4, 'B': 3, 'C': 2, 'D': 1}
+_HEADQUARTERS = frozenset({'NDLS', 'HWH', 'BCT', 'MAS', 'CSMT'})
+
+
+def _build_lod_tiers(index):
+    """{level: stations} built once from the station index.
+
+    The four tiers are static between file edits, so the per-request work
+    in get_stations_by_level collapses to a dict lookup (and, one cache
+    further down, to pre-serialized bytes). This builder is therefore the
+    only place left that walks properties with .get() chains, and it runs
+    once per file change rather than per request.
+    """
+    zone_codes = index['zone_codes']
+    coords_list = index['coords']
+    all_stations = []
+    for i, props in enumerate(index['props']):
+        coords = coords_list[i]
+        category = props.get('category', 'B')
+        all_stations.append({
+            "name": props.get('name', ''),
+            "code": props.get('code', ''),
+            "lat": coords[1],
+            "lon": coords[0],
+            "zone": zone_codes[i] if zone_codes[i] is not None else 'UK',
+            "category": category,
+            "importance": _IMPORTANCE_BY_CATEGORY.get(category, 3)
+        })
+    return {
+        0: [s for s in all_stations if s['code'] in _HEADQUARTERS],
+        1: [s for s in all_stations if s['importance'] >= 5],
+        2: [s for s in all_stations if s['importance'] >= 4],
+        3: all_stations
+    }
+
+
+def _lod_tiers():
+    """LOD tier lists, rebuilt only when fullstations.json changes"""
+    global _LOD_CACHE
+    mtime = _cache_entry(_FULLSTATIONS_PATH)[0]
+    cached = _LOD_CACHE
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    tiers = _build_lod_tiers(_station_index())
+    with _LOD_CACHE_LOCK:
+        _LOD_CACHE = (mtime, tiers)
+    return tiers
+
+
+# Serialized LOD response bodies with their ETags, keyed by file mtime
+_LOD_BYTES_CACHE = None  # (mtime_ns, {level: (body, etag)})
+_LOD_BYTES_LOCK = threading.Lock()
+
+
+def _lod_response_bytes(level):
+    """(body bytes, etag) for one LOD level, serialized once per file change"""
+    global _LOD_BYTES_CACHE
+    mtime = _cache_entry(_FULLSTATIONS_PATH)[0]
+    cached = _LOD_BYTES_CACHE
+    if cached is not None and cached[0] == mtime:
+        return cached[1][level]
+
+    payloads = {}
+    for lvl, stations in _lod_tiers().items():
+        body = _dumps({"stations": stations, "level": lvl, "total": len(stations)})
+        payloads[lvl] = (body, _make_etag(body))
+    with _LOD_BYTES_LOCK:
+        _LOD_BYTES_CACHE = (mtime, payloads)
+    return payloads[level]
+
+
+# Raw UTF-8 JSON bytes for the static (unfiltered) endpoints, validated
+# with one parse on first load and then served as-is. Skips both the
+# per-request parse and JSONResponse's re-serialization.
+_STATIC_BYTES = {}  # Path -> (mtime_ns, bytes, etag)
+_STATIC_BYTES_LOCK = threading.Lock()
+
+# Static data files can be cached by the browser and revalidated via ETag
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+def _make_etag(body):
+    """Strong ETag for a response body (blake2b is ~6x faster than MD5)"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _static_json_bytes(path):
+    """(bytes, etag) of a static JSON file, validated once and cached"""
+    mtime = os.stat(path).st_mtime_ns
+    with _STATIC_BYTES_LOCK:
+        entry = _STATIC_BYTES.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1], entry[2]
+
+    body = path.read_bytes()
+    _loads(body)  # validate once; raises on a corrupt file
+    etag = _make_etag(body)
+
+    with _STATIC_BYTES_LOCK:
+        _STATIC_BYTES[path] = (mtime, body, etag)
+    return body, etag
+
+
+# Serialized zoom-filtered payloads keyed by the exact requested zoom.
+# The render_at_zoom bounds in the data files are fractional (0.1, 1.5,
+# ...), so the zoom must not be quantized; the frontend only ever asks
+# for its fixed ladder of zoom levels, so each (path, zoom, builder)
+# settles into cached bytes after its first request. The dict is
+# bounded in case arbitrary zoom values are thrown at the API.
+_ZOOM_PAYLOAD_CACHE = {}  # (Path, float, builder) -> (mtime_ns, bytes)
+_ZOOM_PAYLOAD_CACHE_MAX = 256
+_ZOOM_PAYLOAD_LOCK = threading.Lock()
+
+
+def _filter_items_by_zoom(items, zoom_level):
+    """Per-item fallback filter for lists without a zoom sidecar"""
+    filtered = []
+    for item in items:
+        render_zoom = item.get('properties', {}).get('render_at_zoom', [0, 35])
+        if isinstance(render_zoom, list) and len(render_zoom) == 2:
+            min_zoom, max_zoom = render_zoom
+            if min_zoom <= zoom_level <= max_zoom:
+                filtered.append(item)
+    return filtered
+
+
+def _build_filtered_geojson(data, meta, zoom_level):
+    """Zoom-filtered copy of a full GeoJSON document"""
+    return filter_geojson_by_zoom(data, zoom_level, meta)
+
+
+def _build_districts_payload(data, meta, zoom_level):
+    """District FeatureCollection payload for a zoom level"""
+    sidecar = (meta or {}).get('districts')
+    if sidecar is not None:
+        ranges, distinct, items = sidecar
+        allowed = {rng for rng in distinct if _range_allows(rng, zoom_level)}
+        filtered = [
+            item for rng, item in zip(ranges, items)
+            if rng in allowed
+        ]
+    else:
+        filtered = _filter_items_by_zoom(data.get('districts', []), zoom_level)
+    return {
+        "type": "FeatureCollection",
+        "features": filtered,
+        "zoom_level": zoom_level,
+    }
+
+
+def _build_assets_payload(data, meta, zoom_level):
+    """Dynamic-assets FeatureCollection payload for a zoom level"""
+    filtered = _filter_items_by_zoom(data.get('assets', []), zoom_level)
+    return {
+        "type": "FeatureCollection",
+        "features": filtered,
+        "zoom_level": zoom_level,
+        "metadata": data.get('metadata', {}),
+    }
+
+
+def _zoom_payload_bytes(path, zoom_level, build):
+    """Serialized payload for a file filtered at the exact zoom level.
+
+    build(data, meta, zoom_level) shapes the response dict; its result
+    is serialized once per requested zoom and invalidated when the file
+    changes. Filtering never quantizes the zoom — a bucketed zoom drops
+    features whose fractional min bound falls inside the bucket and
+    leaks features past their max bound.
+    """
+    mtime, data, meta = _cache_entry(path)
+    key = (path, zoom_level, build)
+    with _ZOOM_PAYLOAD_LOCK:
+        entry = _ZOOM_PAYLOAD_CACHE.get(key)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+    body = _dumps(build(data, meta, zoom_level))
+
+    with _ZOOM_PAYLOAD_LOCK:
+        if len(_ZOOM_PAYLOAD_CACHE) >= _ZOOM_PAYLOAD_CACHE_MAX:
+            _ZOOM_PAYLOAD_CACHE.clear()
+        _ZOOM_PAYLOAD_CACHE[key] = (mtime, body)
+    return body
+
+
+def _etag_json_response(request, body, etag):
+    """Serve cached JSON bytes, honoring If-None-Match with a bodyless 304"""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -63,7 +666,7 @@ async def health_check():
     return {"status": "healthy", "service": "railway-stations-api"}
 
 @app.get("/api/stations")
-async def get_stations(dataset: str = "default"):
+def get_stations(request: Request, dataset: str = "default"):
     """
     Get railway stations data
     
@@ -76,19 +679,17 @@ async def get_stations(dataset: str = "default"):
         else:
             file_path = DATA_DIR / "stations.geojson"
         
-        if not file_path.exists():
+        if not _path_known(file_path):
             raise HTTPException(status_code=404, detail=f"Data file not found: {file_path.name}")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return JSONResponse(content=data)
+
+        body, etag = _static_json_bytes(file_path)
+        return _etag_json_response(request, body, etag)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/india-boundary")
-async def get_india_boundary(detailed: bool = True):
+def get_india_boundary(request: Request, detailed: bool = True):
     """
     Get India boundary GeoJSON
     
@@ -101,30 +702,26 @@ async def get_india_boundary(detailed: bool = True):
         else:
             file_path = DATA_DIR / "india_boundary.geojson"
         
-        if not file_path.exists():
+        if not _path_known(file_path):
             raise HTTPException(status_code=404, detail=f"Data file not found: {file_path.name}")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return JSONResponse(content=data)
+
+        body, etag = _static_json_bytes(file_path)
+        return _etag_json_response(request, body, etag)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/states")
-async def get_states():
+def get_states(request: Request):
     """Get state boundaries GeoJSON"""
     try:
         file_path = DATA_DIR / "states.geojson"
         
-        if not file_path.exists():
+        if not _path_known(file_path):
             raise HTTPException(status_code=404, detail="States data file not found")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return JSONResponse(content=data)
+
+        body, etag = _static_json_bytes(file_path)
+        return _etag_json_response(request, body, etag)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -167,23 +764,37 @@ async def get_llm_providers():
             "fallback_enabled": llm_manager.fallback_to_rules
         })
     except Exception as e:
-        logger.error(f"Error getting providers: {e}")
+        logger.error("Error getting providers: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-class ProviderSwitchRequest(BaseModel):
-    provider: str
+def _body_str_field(body, field):
+    """Extract a required string field from a raw JSON request body.
+
+    The POST bodies here are single-string payloads; parsing them
+    directly with _loads skips the model validation layer.
+    """
+    try:
+        payload = _loads(body)
+    except Exception:
+        raise HTTPException(status_code=422, detail="Invalid JSON body")
+    value = payload.get(field) if isinstance(payload, dict) else None
+    if not isinstance(value, str):
+        raise HTTPException(status_code=422, detail=f"Field '{field}' must be a string")
+    return value
 
 
 @app.post("/api/llm/switch-provider")
-async def switch_llm_provider(req: ProviderSwitchRequest):
+async def switch_llm_provider(request: Request):
     """Switch to a different LLM provider"""
+    # Parse outside the try block so a malformed body surfaces as the
+    # 422 from _body_str_field rather than being rewrapped as a 500
+    provider_name = _body_str_field(await request.body(), "provider").lower()
     try:
-        provider_name = req.provider.lower()
         success = llm_manager.set_active_provider(provider_name)
         
         if success:
-            logger.info(f"✅ Successfully switched to provider: {provider_name}")
+            logger.info("✅ Successfully switched to provider: %s", provider_name)
             return JSONResponse(content={
                 "success": True,
                 "provider": provider_name,
@@ -198,7 +809,7 @@ async def switch_llm_provider(req: ProviderSwitchRequest):
                 status_code=400
             )
     except Exception as e:
-        logger.error(f"Error switching provider: {e}")
+        logger.error("Error switching provider: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -217,12 +828,12 @@ async def get_llm_status():
             }
         })
     except Exception as e:
-        logger.error(f"Error getting LLM status: {e}")
+        logger.error("Error getting LLM status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/location-coordinates/{location_name}")
-async def get_location_coordinates(location_name: str):
+def get_location_coordinates(location_name: str):
     """Get coordinates for a location name (city, station, etc.)"""
     try:
         location_lower = location_name.lower().strip()
@@ -257,81 +868,63 @@ async def get_location_coordinates(location_name: str):
             if location_lower in key or key in location_lower:
                 return JSONResponse(content=value)
         
-        # Search in cities file
-        cities_path = DATA_DIR / "cities" / "indian_cities.geojson"
-        if cities_path.exists():
-            with open(cities_path, 'r') as f:
-                cities_data = json.load(f)
-            
-            for feature in cities_data.get('features', []):
-                props = feature.get('properties', {})
-                city_name = props.get('name', '').lower()
-                
-                if location_lower in city_name or city_name in location_lower:
-                    coords = feature['geometry'].get('coordinates', [])
-                    if coords and len(coords) >= 2:
-                        return JSONResponse(content={
-                            "lat": coords[1],
-                            "lon": coords[0],
-                            "name": props.get('name')
-                        })
+        # Search in cities (pre-lowercased entries)
+        for city_name, entry, coord in _CITY_ENTRIES:
+            if location_lower in city_name or city_name in location_lower:
+                if coord:
+                    return JSONResponse(content={
+                        "lat": coord['lat'],
+                        "lon": coord['lon'],
+                        "name": entry['name']
+                    })
         
-        # Search in stations
-        stations_path = DATA_DIR / "fullstations.json"
-        if stations_path.exists():
-            with open(stations_path, 'r') as f:
-                stations_data = json.load(f)
-            
-            if 'zones' in stations_data:
-                for zone_data in stations_data['zones'].values():
-                    for feature in zone_data.get('features', []):
-                        props = feature.get('properties', {})
-                        station_name = props.get('name', '').lower()
-                        
-                        if location_lower in station_name or station_name in location_lower:
-                            return JSONResponse(content={
-                                "lat": props.get('lat'),
-                                "lon": props.get('lon'),
-                                "name": props.get('name')
-                            })
+        # Search in stations (pre-lowercased index)
+        if _path_known(_FULLSTATIONS_PATH):
+            idx = _station_index()
+            props_list = idx['props']
+            for i, station_name in enumerate(idx['names_lower']):
+                if location_lower in station_name or station_name in location_lower:
+                    props = props_list[i]
+                    return JSONResponse(content={
+                        "lat": props.get('lat'),
+                        "lon": props.get('lon'),
+                        "name": props.get('name')
+                    })
         
         raise HTTPException(status_code=404, detail=f"Location '{location_name}' not found")
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error finding location coordinates: {e}")
+        logger.error("Error finding location coordinates: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/scenes")
-async def get_scenes():
+def get_scenes():
     """Get all available 3D scenes"""
     try:
         scenes_path = DATA_DIR / "scenes.json"
-        if not scenes_path.exists():
+        if not _path_known(scenes_path):
             return JSONResponse(content={"scenes": []})
         
-        with open(scenes_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return JSONResponse(content=data)
+        body, _ = _static_json_bytes(scenes_path)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
-        logger.error(f"Error loading scenes: {e}")
+        logger.error("Error loading scenes: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/scenes/at-location")
-async def get_scenes_at_location(lat: float, lon: float, zoom: float = 10):
+def get_scenes_at_location(lat: float, lon: float, zoom: float = 10):
     """Get scenes near a specific location and zoom level"""
     try:
         scenes_path = DATA_DIR / "scenes.json"
-        if not scenes_path.exists():
+        if not _path_known(scenes_path):
             return JSONResponse(content={"scenes": []})
         
-        with open(scenes_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        data = _load_json_cached(scenes_path)
+
         matching_scenes = []
         
         for scene in data.get('scenes', []):
@@ -340,7 +933,6 @@ async def get_scenes_at_location(lat: float, lon: float, zoom: float = 10):
             trigger = scene.get('trigger', {})
             
             # Calculate distance (simple approximation)
-            import math
             lat_diff = abs(lat - scene_lat)
             lon_diff = abs(lon - scene_lon)
             distance_km = math.sqrt(lat_diff**2 + lon_diff**2) * 111  # rough km conversion
@@ -355,191 +947,147 @@ async def get_scenes_at_location(lat: float, lon: float, zoom: float = 10):
             if distance_km <= radius_km and min_zoom <= zoom <= max_zoom:
                 matching_scenes.append(scene)
         
-        return JSONResponse(content={"scenes": matching_scenes, "count": len(matching_scenes)})
+        return Response(content=_dumps({"scenes": matching_scenes, "count": len(matching_scenes)}),
+                        media_type="application/json")
     
     except Exception as e:
-        logger.error(f"Error finding scenes at location: {e}")
+        logger.error("Error finding scenes at location: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/scenes/{scene_id}")
-async def get_scene(scene_id: str):
+def get_scene(scene_id: str):
     """Get a specific scene by ID"""
     try:
         scenes_path = DATA_DIR / "scenes.json"
-        if not scenes_path.exists():
+        if not _path_known(scenes_path):
             raise HTTPException(status_code=404, detail="Scenes file not found")
         
-        with open(scenes_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        data = _load_json_cached(scenes_path)
+
         # Find the scene
         scene = next((s for s in data.get('scenes', []) if s['id'] == scene_id), None)
         
         if not scene:
             raise HTTPException(status_code=404, detail=f"Scene {scene_id} not found")
         
-        return JSONResponse(content=scene)
+        return Response(content=_dumps(scene), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error loading scene {scene_id}: {e}")
+        logger.error("Error loading scene %s: %s", scene_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # Helper Functions for Multi-Level GeoJSON
 
-def filter_geojson_by_zoom(data, zoom_level):
-    """Filter GeoJSON features based on zoom level"""
+def filter_geojson_by_zoom(data, zoom_level, meta=None):
+    """Filter GeoJSON features based on zoom level.
+
+    When the caller has the file's precomputed zoom sidecar (from
+    _cache_entry), the filter is one scan per list over parallel min/max
+    arrays; otherwise the sidecar is built on the fly.
+    """
     if not isinstance(data, dict) or 'features' not in data:
         return data
-    
-    filtered_features = []
-    
-    # Process main features
-    for feature in data.get('features', []):
-        props = feature.get('properties', {})
-        render_zoom = props.get('render_at_zoom', [0, 35])
-        
-        if isinstance(render_zoom, list) and len(render_zoom) == 2:
-            min_zoom, max_zoom = render_zoom
-            if min_zoom <= zoom_level <= max_zoom:
-                filtered_features.append(feature)
-    
-    # Process additional data arrays (districts, cities, landmarks)
-    result = data.copy()
-    result['features'] = filtered_features
-    
-    for key in ['districts', 'cities', 'landmarks']:
-        if key in data:
-            filtered_items = []
-            for item in data[key]:
-                props = item.get('properties', {})
-                render_zoom = props.get('render_at_zoom', [0, 35])
-                
-                if isinstance(render_zoom, list) and len(render_zoom) == 2:
-                    min_zoom, max_zoom = render_zoom
-                    if min_zoom <= zoom_level <= max_zoom:
-                        filtered_items.append(item)
-            
-            result[key] = filtered_items
-    
+
+    if meta is None:
+        meta = _build_zoom_meta(data)
+
+    # Build the result explicitly: pass-through keys (type, name,
+    # metadata, ...) are carried over by reference, and only the
+    # zoom-aware lists are rebuilt. No blanket dict copy.
+    result = {key: value for key, value in data.items() if key not in meta}
+    for key, (ranges, distinct, items) in meta.items():
+        # Evaluate the predicate once per distinct range, then keep
+        # features by set membership on the interned tuples
+        allowed = {rng for rng in distinct if _range_allows(rng, zoom_level)}
+        result[key] = [
+            item for rng, item in zip(ranges, items)
+            if rng in allowed
+        ]
+
     return result
 
-async def get_states_data(zoom_level):
+def get_states_data(zoom_level):
     """Get state boundary data for zoom level"""
     try:
         # For now, return Delhi state as example
         file_path = DATA_DIR / "states" / "delhi.geojson"
         
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            filtered_data = filter_geojson_by_zoom(data, zoom_level)
-            return JSONResponse(content=filtered_data)
-        
+        if _path_known(file_path):
+            body = _zoom_payload_bytes(file_path, zoom_level, _build_filtered_geojson)
+            return Response(content=body, media_type="application/json")
+
         # Fallback to original states.geojson
         file_path = DATA_DIR / "states.geojson"
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return JSONResponse(content=data)
+        body, _ = _static_json_bytes(file_path)
+
+        return Response(content=body, media_type="application/json")
     
     except Exception as e:
-        logger.error(f"❌ [States] Error: {e}")
+        logger.error("❌ [States] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-async def get_districts_data(zoom_level):
+def get_districts_data(zoom_level):
     """Get district boundary data for zoom level"""
     try:
         # For now, return district data from Delhi state file
         file_path = DATA_DIR / "states" / "delhi.geojson"
         
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Extract districts
-            districts = data.get('districts', [])
-            filtered_districts = []
-            
-            for district in districts:
-                props = district.get('properties', {})
-                render_zoom = props.get('render_at_zoom', [0, 35])
-                
-                if isinstance(render_zoom, list) and len(render_zoom) == 2:
-                    min_zoom, max_zoom = render_zoom
-                    if min_zoom <= zoom_level <= max_zoom:
-                        filtered_districts.append(district)
-            
-            return JSONResponse(content={
-                "type": "FeatureCollection",
-                "features": filtered_districts,
-                "zoom_level": zoom_level
-            })
-        
+        if _path_known(file_path):
+            body = _zoom_payload_bytes(file_path, zoom_level, _build_districts_payload)
+            return Response(content=body, media_type="application/json")
+
         return JSONResponse(content={"type": "FeatureCollection", "features": []})
-    
+
     except Exception as e:
-        logger.error(f"❌ [Districts] Error: {e}")
+        logger.error("❌ [Districts] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-async def get_cities_data(zoom_level):
+def get_cities_data(zoom_level):
     """Get cities data for zoom level"""
     try:
         file_path = DATA_DIR / "cities" / "indian_cities.geojson"
         
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            filtered_data = filter_geojson_by_zoom(data, zoom_level)
-            return JSONResponse(content=filtered_data)
-        
+        if _path_known(file_path):
+            body = _zoom_payload_bytes(file_path, zoom_level, _build_filtered_geojson)
+            return Response(content=body, media_type="application/json")
+
         return JSONResponse(content={"type": "FeatureCollection", "features": []})
-    
+
     except Exception as e:
-        logger.error(f"❌ [Cities] Error: {e}")
+        logger.error("❌ [Cities] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-async def get_dynamic_assets(zoom_level):
+def get_dynamic_assets(zoom_level):
     """Get dynamic assets (drones, vehicles) for zoom level"""
     try:
         file_path = DATA_DIR / "assets" / "dynamic_assets.geojson"
         
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Filter assets based on zoom level
-            filtered_assets = []
-            for asset in data.get('assets', []):
-                props = asset.get('properties', {})
-                render_zoom = props.get('render_at_zoom', [0, 35])
-                
-                if isinstance(render_zoom, list) and len(render_zoom) == 2:
-                    min_zoom, max_zoom = render_zoom
-                    if min_zoom <= zoom_level <= max_zoom:
-                        filtered_assets.append(asset)
-            
-            return JSONResponse(content={
-                "type": "FeatureCollection",
-                "features": filtered_assets,
-                "zoom_level": zoom_level,
-                "metadata": data.get('metadata', {})
-            })
-        
+        if _path_known(file_path):
+            body = _zoom_payload_bytes(file_path, zoom_level, _build_assets_payload)
+            return Response(content=body, media_type="application/json")
+
         return JSONResponse(content={"type": "FeatureCollection", "features": []})
-    
+
     except Exception as e:
-        logger.error(f"❌ [Assets] Error: {e}")
+        logger.error("❌ [Assets] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 # New Multi-Level GeoJSON API Endpoints
 
+# data_type -> helper, resolved with one dict lookup per request
+_GEOJSON_DISPATCH = {
+    "states": get_states_data,
+    "districts": get_districts_data,
+    "cities": get_cities_data,
+    "assets": get_dynamic_assets,
+}
+
+
 @app.get("/api/geojson/{data_type}/zoom/{zoom_level}")
-async def get_geojson_by_zoom(data_type: str, zoom_level: float):
+def get_geojson_by_zoom(data_type: str, zoom_level: float):
     """
     Get GeoJSON data filtered by zoom level
     
@@ -548,54 +1096,47 @@ async def get_geojson_by_zoom(data_type: str, zoom_level: float):
     - zoom_level: Current zoom level (0.1 to 35)
     """
     try:
-        logger.info(f"🗺️ [GeoJSON] Request: {data_type} at zoom {zoom_level}")
+        logger.info("🗺️ [GeoJSON] Request: %s at zoom %s", data_type, zoom_level)
         
-        if data_type == "states":
-            return await get_states_data(zoom_level)
-        elif data_type == "districts":
-            return await get_districts_data(zoom_level)
-        elif data_type == "cities":
-            return await get_cities_data(zoom_level)
-        elif data_type == "assets":
-            return await get_dynamic_assets(zoom_level)
-        else:
+        handler = _GEOJSON_DISPATCH.get(data_type)
+        if handler is None:
             raise HTTPException(status_code=400, detail=f"Invalid data type: {data_type}")
+        return handler(zoom_level)
             
     except Exception as e:
-        logger.error(f"❌ [GeoJSON] Error: {e}")
+        logger.error("❌ [GeoJSON] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/states/{state_code}")
-async def get_state_details(state_code: str, zoom_level: float = 5):
+def get_state_details(state_code: str, zoom_level: float = 5):
     """Get detailed state data including districts, cities, landmarks"""
     try:
         file_path = DATA_DIR / "states" / f"{state_code.lower()}.geojson"
         
-        if not file_path.exists():
+        if not _path_known(file_path):
             raise HTTPException(status_code=404, detail=f"State data not found: {state_code}")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+
+        _, data, meta = _cache_entry(file_path)
+
         # Filter based on zoom level
-        filtered_data = filter_geojson_by_zoom(data, zoom_level)
+        filtered_data = filter_geojson_by_zoom(data, zoom_level, meta)
         
-        logger.info(f"✅ [States] {state_code}: {len(filtered_data.get('features', []))} features at zoom {zoom_level}")
+        logger.info("✅ [States] %s: %d features at zoom %s", state_code, len(filtered_data.get('features', [])), zoom_level)
         return JSONResponse(content=filtered_data)
         
     except Exception as e:
-        logger.error(f"❌ [States] Error for {state_code}: {e}")
+        logger.error("❌ [States] Error for %s: %s", state_code, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/cities/zoom/{zoom_level}")
-async def get_cities_by_zoom(zoom_level: float):
+def get_cities_by_zoom(zoom_level: float):
     """Get cities filtered by zoom level"""
-    return await get_cities_data(zoom_level)
+    return get_cities_data(zoom_level)
 
 @app.get("/api/assets/dynamic")
-async def get_dynamic_assets_current(zoom_level: float = 5):
+def get_dynamic_assets_current(zoom_level: float = 5):
     """Get current dynamic assets (drones, vehicles, etc.)"""
-    return await get_dynamic_assets(zoom_level)
+    return get_dynamic_assets(zoom_level)
 
 @app.post("/api/assets/{asset_id}/move")
 async def move_asset(asset_id: str, direction: str, distance: float = 0.001):
@@ -620,12 +1161,166 @@ async def get_actions():
     return {"actions": ACTIONS}
 
 
-class CommandRequest(BaseModel):
-    text: str
+# Rule-based parser patterns, compiled once at import. Hot path: every
+# command that falls through the LLM provider runs these, so avoid the
+# re module's internal cache lookup on each call.
+_PAT_JSON_ARRAY = re.compile(r"(\[.*\])", re.S)
+# Recently interpreted commands. The map's voice/text vocabulary is
+# small and users re-issue the same commands, so repeats skip the LLM
+# round-trip and the regex pass entirely.
+_CMD_CACHE = OrderedDict()  # lowercased text -> actions list
+_CMD_CACHE_MAX = 512
+_CMD_CACHE_LOCK = threading.Lock()
+
+
+def _cmd_cache_get(key):
+    with _CMD_CACHE_LOCK:
+        actions = _CMD_CACHE.get(key)
+        if actions is not None:
+            _CMD_CACHE.move_to_end(key)
+        return actions
+
+
+def _cmd_cache_put(key, actions):
+    with _CMD_CACHE_LOCK:
+        _CMD_CACHE[key] = actions
+        _CMD_CACHE.move_to_end(key)
+        while len(_CMD_CACHE) > _CMD_CACHE_MAX:
+            _CMD_CACHE.popitem(last=False)
+
+
+# The rule-based command grammar as a priority-ordered table of
+# precompiled patterns; each name maps to a builder in _COMMAND_DISPATCH.
+# Every pattern is tried over the whole text in order, exactly like the
+# original if-ladder (a single folded alternation is NOT equivalent: it
+# picks the leftmost match, so e.g. "reset and zoom to 5x" would become
+# reset instead of zoom). Compilation is hoisted to import time, which
+# was the expensive part of the ladder.
+_COMMAND_PATTERNS = [
+    ("zoom_to", r"zoom to (?P<zt_val>\d+(?:\.\d+)?)x"),
+    ("zoom_dir_to", r"zoom (?:in|out) to (?P<zdt_val>\d+(?:\.\d+)?)x"),
+    ("zoom_dir_by", r"zoom (?P<zdb_dir>in|out) by (?P<zdb_val>\d+(?:\.\d+)?)x"),
+    ("zoom_out", r"zoom\s+out(?:\s+to\s+india)?$|show\s+full\s+map"),
+    ("reset", r"reset"),
+    ("latlon", r"zoom to lat[:=\s]*(?P<ll_lat>[0-9.+-]+)\s*,?\s*lon[:=\s]*(?P<ll_lon>[0-9.+-]+)"),
+    ("goto_station", r"goto station (?P<gs_name>.+)"),
+    ("trip", r"(?:start\s+)?(?:trip|journey)\s+from\s+(?P<trip_src>[a-zA-Z\s]+?)\s+to\s+(?P<trip_dst>[a-zA-Z\s]+?)(?:\s+at\s+(?P<trip_speed>\d+(?:\.\d+)?)x?\s*speed)?(?:\s|$)"),
+    ("cam_move", r"move\s+camera\s+(?P<cm_dir>left|right|up|down|forward|backward)(?:\s+by\s+)?(?P<cm_dist>\d+(?:\.\d+)?)?(?:\s+units?)?"),
+    ("cam_offset", r"(?:move\s+camera\s+to|camera\s+position)\s+x[:=\s]*(?P<co_x>[0-9.+-]+)\s*y[:=\s]*(?P<co_y>[0-9.+-]+)\s*z[:=\s]*(?P<co_z>[0-9.+-]+)"),
+    ("show_view", r"(?:show\s+location\s+view|view|go\s+to|show)\s+(?P<sv_loc>[a-zA-Z\s]+?)(?:\s+station|\s+metro|\s+airport|$)"),
+    ("goto_loc", r"(?:goto|move\s+(?:to|camera\s+to))\s+(?:location\s+)?(?:lat\s*)?(?P<gl_lat>[0-9.+-]+)\s*,?\s*(?:lon\s*)?(?P<gl_lon>[0-9.+-]+)"),
+    ("coords", r"(?P<c_lat>[0-9.+-]+)\s*,\s*(?P<c_lon>[0-9.+-]+)"),
+]
+_COMMAND_REGEXES = [
+    (name, re.compile(pattern)) for name, pattern in _COMMAND_PATTERNS
+]
+
+
+def _cmd_zoom_to(m):
+    return [{"type": "zoom", "mode": "to", "value": float(m.group('zt_val'))}]
+
+
+def _cmd_zoom_dir_to(m):
+    return [{"type": "zoom", "mode": "to", "value": float(m.group('zdt_val'))}]
+
+
+def _cmd_zoom_dir_by(m):
+    val = float(m.group('zdb_val'))
+    factor = val if m.group('zdb_dir') == 'in' else (1.0 / val)
+    return [{"type": "zoom", "mode": "by", "value": factor}]
+
+
+def _cmd_zoom_out(m):
+    return [{"type": "zoom_out"}]
+
+
+def _cmd_reset(m):
+    return [{"type": "reset"}]
+
+
+def _cmd_latlon(m):
+    return [{"type": "center", "lat": float(m.group('ll_lat')), "lon": float(m.group('ll_lon'))}]
+
+
+def _cmd_goto_station(m):
+    return [{"type": "goto_station", "name": m.group('gs_name').strip()}]
+
+
+def _cmd_trip(m):
+    speed = float(m.group('trip_speed')) if m.group('trip_speed') else 3.0  # Default speed 3.0x
+    return [{
+        "type": "start_trip",
+        "source": m.group('trip_src').strip(),
+        "destination": m.group('trip_dst').strip(),
+        "speed": speed
+    }]
+
+
+def _cmd_cam_move(m):
+    distance = float(m.group('cm_dist')) if m.group('cm_dist') else 10  # Default 10 units
+    action = {
+        "type": "move_camera",
+        "direction": m.group('cm_dir'),
+        "distance": distance,
+        "duration": 2000
+    }
+    logger.info("✅ Parsed camera move action: %s", action)
+    return [action]
+
+
+def _cmd_cam_offset(m):
+    return [{
+        "type": "camera_offset",
+        "x": float(m.group('co_x')),
+        "y": float(m.group('co_y')),
+        "z": float(m.group('co_z')),
+        "duration": 2000
+    }]
+
+
+def _cmd_show_view(m):
+    location_name = m.group('sv_loc').strip()
+    logger.info("✅ Parsed show location view: %s", location_name)
+    return [{
+        "type": "show_location_view",
+        "location": location_name,
+        "zoom": 25  # Zoom level to trigger 3D scenes
+    }]
+
+
+def _cmd_goto_loc(m):
+    return [{
+        "type": "goto_location",
+        "lat": float(m.group('gl_lat')),
+        "lon": float(m.group('gl_lon')),
+        "altitude": 50,
+        "duration": 2000
+    }]
+
+
+def _cmd_coords(m):
+    return [{"type": "center", "lat": float(m.group('c_lat')), "lon": float(m.group('c_lon'))}]
+
+
+_COMMAND_DISPATCH = {
+    "zoom_to": _cmd_zoom_to,
+    "zoom_dir_to": _cmd_zoom_dir_to,
+    "zoom_dir_by": _cmd_zoom_dir_by,
+    "zoom_out": _cmd_zoom_out,
+    "reset": _cmd_reset,
+    "latlon": _cmd_latlon,
+    "goto_station": _cmd_goto_station,
+    "trip": _cmd_trip,
+    "cam_move": _cmd_cam_move,
+    "cam_offset": _cmd_cam_offset,
+    "show_view": _cmd_show_view,
+    "goto_loc": _cmd_goto_loc,
+    "coords": _cmd_coords,
+}
 
 
 @app.post("/api/interpret-command")
-async def interpret_command(req: CommandRequest):
+async def interpret_command(request: Request):
     """Interpret a natural language command and return structured actions.
 
     The response format is a list of actions:
@@ -634,8 +1329,14 @@ async def interpret_command(req: CommandRequest):
      {"type": "center", "lat": 12.3, "lon": 77.5},
      {"type": "goto_station", "name": "New Delhi (NDLS)"}]
     """
-    text = req.text.strip()
-    logger.info(f"🔍 Interpreting command: {text} (Provider: {llm_manager.active_provider_name})")
+    text = _body_str_field(await request.body(), "text").strip()
+    logger.info("🔍 Interpreting command: %s (Provider: %s)", text, llm_manager.active_provider_name)
+
+    # Repeat command: serve the previously parsed actions
+    cache_key = text.lower()
+    cached = _cmd_cache_get(cache_key)
+    if cached is not None:
+        return JSONResponse(content={"actions": cached, "method": "cache"})
 
     # Try to use the active LLM provider
     try:
@@ -666,167 +1367,180 @@ async def interpret_command(req: CommandRequest):
             content = llm_manager.generate(prompt)
             
             # Try to extract JSON from response
-            import re
-            m = re.search(r"(\[.*\])", content, re.S)
+            m = _PAT_JSON_ARRAY.search(content)
             json_text = m.group(1) if m else content
             actions = json.loads(json_text)
             
-            logger.info(f"✅ LLM parsed successfully: {actions}")
+            logger.info("✅ LLM parsed successfully: %s", actions)
+            _cmd_cache_put(cache_key, actions)
             return JSONResponse(content={
                 "actions": actions,
                 "provider": llm_manager.active_provider_name,
                 "method": "llm"
             })
         else:
-            logger.warning(f"Provider {llm_manager.active_provider_name} is not available")
+            logger.warning("Provider %s is not available", llm_manager.active_provider_name)
             
     except Exception as e:
-        logger.error(f"❌ LLM parsing failed: {e}")
+        logger.error("❌ LLM parsing failed: %s", e)
         if not llm_manager.should_fallback_to_rules():
             raise HTTPException(status_code=500, detail=f"LLM parsing failed: {str(e)}")
 
     # Rule-based fallback parser
     logger.info("📋 Using rule-based parser as fallback")
-    actions = []
     lower = text.lower()
 
-    # Zoom to X times
-    import re
-    m = re.search(r"zoom to (\d+(?:\.\d+)?)x", lower)
-    if m:
-        val = float(m.group(1))
-        actions.append({"type": "zoom", "mode": "to", "value": val})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Zoom in/out by or to number
-    m2 = re.search(r"zoom (in|out) to (\d+(?:\.\d+)?)x", lower)
-    if m2:
-        direction, val = m2.group(1), float(m2.group(2))
-        actions.append({"type": "zoom", "mode": "to", "value": val})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    m3 = re.search(r"zoom (in|out) by (\d+(?:\.\d+)?)x", lower)
-    if m3:
-        dirc, val = m3.group(1), float(m3.group(2))
-        factor = val if dirc == 'in' else (1.0/val)
-        actions.append({"type": "zoom", "mode": "by", "value": factor})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Zoom out to full India map
-    if re.search(r"zoom\s+out(?:\s+to\s+india)?$", lower) or re.search(r"show\s+full\s+map", lower):
-        actions.append({"type": "zoom_out"})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Reset view
-    if re.search(r"reset", lower):
-        actions.append({"type": "reset"})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Zoom to lat lon
-    m4 = re.search(r"zoom to lat[:=\s]*([0-9.+-]+)\s*,?\s*lon[:=\s]*([0-9.+-]+)", lower)
-    if m4:
-        lat = float(m4.group(1)); lon = float(m4.group(2))
-        actions.append({"type": "center", "lat": lat, "lon": lon})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Goto station by name (automatically zooms to 400km radius)
-    m5 = re.search(r"goto station (.+)", lower)
-    if m5:
-        name = m5.group(1).strip()
-        actions.append({"type": "goto_station", "name": name})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Start trip from source to destination
-    # Pattern: "start trip from X to Y" or "trip from X to Y" with optional speed
-    trip_pattern = r"(?:start\s+)?(?:trip|journey)\s+from\s+([a-zA-Z\s]+?)\s+to\s+([a-zA-Z\s]+?)(?:\s+at\s+(\d+(?:\.\d+)?)x?\s*speed)?(?:\s|$)"
-    m_trip = re.search(trip_pattern, lower)
-    if m_trip:
-        source = m_trip.group(1).strip()
-        destination = m_trip.group(2).strip()
-        speed = float(m_trip.group(3)) if m_trip.group(3) else 3.0  # Default speed 3.0x
-        actions.append({
-            "type": "start_trip",
-            "source": source,
-            "destination": destination,
-            "speed": speed
-        })
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-
-    # Camera movement: "move camera left/right/up/down by X"
-    camera_move_pattern = r"move\s+camera\s+(left|right|up|down|forward|backward)(?:\s+by\s+)?(\d+(?:\.\d+)?)?(?:\s+units?)?"
-    m_cam = re.search(camera_move_pattern, lower)
-    if m_cam:
-        direction = m_cam.group(1)
-        distance = float(m_cam.group(2)) if m_cam.group(2) else 10  # Default 10 units
-        action = {
-            "type": "move_camera",
-            "direction": direction,
-            "distance": distance,
-            "duration": 2000
-        }
-        logger.info(f"✅ Parsed camera move action: {action}")
-        actions.append(action)
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-    
-    # Camera offset: "move camera to x=10 y=20 z=30" or "camera position x 10 y 20 z 30"
-    offset_pattern = r"(?:move\s+camera\s+to|camera\s+position)\s+x[:=\s]*([0-9.+-]+)\s*y[:=\s]*([0-9.+-]+)\s*z[:=\s]*([0-9.+-]+)"
-    m_offset = re.search(offset_pattern, lower)
-    if m_offset:
-        x, y, z = float(m_offset.group(1)), float(m_offset.group(2)), float(m_offset.group(3))
-        actions.append({
-            "type": "camera_offset",
-            "x": x,
-            "y": y,
-            "z": z,
-            "duration": 2000
-        })
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-    
-    # Show location view: "show location view mumbai", "view mumbai", "go to mumbai"
-    show_view_pattern = r"(?:show\s+location\s+view|view|go\s+to|show)\s+([a-zA-Z\s]+?)(?:\s+station|\s+metro|\s+airport|$)"
-    m_view = re.search(show_view_pattern, lower)
-    if m_view:
-        location_name = m_view.group(1).strip()
-        actions.append({
-            "type": "show_location_view",
-            "location": location_name,
-            "zoom": 25  # Zoom level to trigger 3D scenes
-        })
-        logger.info(f"✅ Parsed show location view: {location_name}")
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-    
-    # Goto location: "goto location 28.64, 77.22" or "camera to lat 28.64 lon 77.22"
-    goto_loc_pattern = r"(?:goto|move\s+(?:to|camera\s+to))\s+(?:location\s+)?(?:lat\s*)?([0-9.+-]+)\s*,?\s*(?:lon\s*)?([0-9.+-]+)"
-    m_goto = re.search(goto_loc_pattern, lower)
-    if m_goto:
-        lat, lon = float(m_goto.group(1)), float(m_goto.group(2))
-        actions.append({
-            "type": "goto_location",
-            "lat": lat,
-            "lon": lon,
-            "altitude": 50,
-            "duration": 2000
-        })
-        return JSONResponse(content={"actions": actions, "method": "rules"})
-    
-    # Fallback: if contains coordinates
-    m6 = re.search(r"([0-9.+-]+)\s*,\s*([0-9.+-]+)", lower)
-    if m6:
-        lat = float(m6.group(1)); lon = float(m6.group(2))
-        actions.append({"type": "center", "lat": lat, "lon": lon})
-        return JSONResponse(content={"actions": actions, "method": "rules"})
+    # Try each precompiled pattern in priority order over the whole text
+    for name, regex in _COMMAND_REGEXES:
+        m = regex.search(lower)
+        if m:
+            actions = _COMMAND_DISPATCH[name](m)
+            _cmd_cache_put(cache_key, actions)
+            return JSONResponse(content={"actions": actions, "method": "rules"})
 
     # Unrecognized
     return JSONResponse(content={"actions": [], "error": "Could not parse command"}, status_code=200)
 
 
+def _warm_data_caches():
+    """Parse all known data files concurrently at startup.
+
+    Reads and parses are fanned out over a few threads (orjson releases
+    the GIL while parsing), so cold-start latency is bounded by the
+    largest file instead of the sum of all of them. Failures are logged
+    and left for the owning endpoint to report.
+    """
+    def warm_one(path):
+        try:
+            _cache_entry(path)
+        except Exception as e:
+            logger.error(f"Error preloading {path}: {e}")
+
+    files = [p for p in _KNOWN_FILES if p.is_file()]
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="data-warm") as pool:
+        list(pool.map(warm_one, files))
+
+
+_warm_data_caches()
+
+
+# Prebuilt location indexes. The state files and city list are static,
+# so their per-location summaries are extracted once at import; a request
+# is then a dict lookup plus a name scan instead of re-globbing and
+# re-parsing every file.
+
+def _geometry_center(geometry):
+    """Mean of all coordinate pairs in a geometry (approximate center).
+
+    Walks Polygon/MultiPolygon nesting iteratively; runs once per state
+    at index build, so requests read two precomputed floats.
+    """
+    coords = geometry.get('coordinates', []) if geometry else []
+    lat_sum = lon_sum = 0.0
+    count = 0
+    stack = [coords]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, list) or not node:
+            continue
+        if isinstance(node[0], (int, float)):
+            if len(node) > 1:
+                lon_sum += node[0]
+                lat_sum += node[1]
+                count += 1
+        else:
+            stack.extend(node)
+    if not count:
+        return None
+    return {'lat': lat_sum / count, 'lon': lon_sum / count}
+
+
+def _index_state_file(path):
+    """(lowercased state name, precomputed summary) for one state file"""
+    state_data = _load_json_cached(path)
+    name = state_data.get('properties', {}).get('name', '').lower()
+    if not name:
+        return None, None
+
+    entry = {'districts': [], 'cities': [], 'landmarks': [], 'coordinates': None}
+    for feature in state_data.get('features', []):
+        props = feature.get('properties', {})
+        feature_type = props.get('type', 'unknown')
+
+        if feature_type == 'district':
+            entry['districts'].append({
+                'name': props.get('name'),
+                'code': props.get('code'),
+                'population': props.get('population'),
+                'area': props.get('area')
+            })
+        elif feature_type == 'city':
+            entry['cities'].append({
+                'name': props.get('name'),
+                'population': props.get('population'),
+                'tier': props.get('tier')
+            })
+        elif feature_type == 'landmark':
+            entry['landmarks'].append({
+                'name': props.get('name'),
+                'category': props.get('category'),
+                'importance': props.get('importance')
+            })
+
+    # State center, computed once here instead of per request
+    entry['coordinates'] = _geometry_center(state_data.get('geometry'))
+    return name, entry
+
+
+def _build_state_index():
+    """lowercased state name -> precomputed location summary"""
+    index = {}
+    states_path = DATA_DIR / "states"
+    if states_path.exists():
+        for state_file in states_path.glob("*.geojson"):
+            try:
+                name, entry = _index_state_file(state_file)
+                if name:
+                    index[name] = entry
+            except Exception as e:
+                logger.error(f"Error indexing state file {state_file}: {e}")
+    return index
+
+
+def _build_city_entries():
+    """(lowercased name, summary dict, coordinates) per city, in file order"""
+    entries = []
+    cities_path = DATA_DIR / "cities" / "indian_cities.geojson"
+    if cities_path.exists():
+        try:
+            cities_data = _load_json_cached(cities_path)
+            for feature in cities_data.get('features', []):
+                props = feature.get('properties', {})
+                entry = {
+                    'name': props.get('name'),
+                    'state': props.get('state'),
+                    'population': props.get('population'),
+                    'tier': props.get('tier')
+                }
+                coords = (feature.get('geometry') or {}).get('coordinates', [])
+                coord = {'lat': coords[1], 'lon': coords[0]} if coords and len(coords) >= 2 else None
+                entries.append((props.get('name', '').lower(), entry, coord))
+        except Exception as e:
+            logger.error(f"Error indexing cities file: {e}")
+    return entries
+
+
+_STATE_INDEX = _build_state_index()
+_CITY_ENTRIES = _build_city_entries()
+
+
 @app.get("/api/location-details/{location_name}")
-async def get_location_details(location_name: str, page: int = 1, page_size: int = 10):
+def get_location_details(location_name: str, page: int = 1, page_size: int = 10):
     """
     Get detailed information about a location (city, state, district) with pagination.
     Returns stations, landmarks, districts, and other features for the location.
     """
-    logger.info(f"🔍 [Location Details] Fetching details for: {location_name}, page: {page}")
+    logger.info("🔍 [Location Details] Fetching details for: %s, page: %s", location_name, page)
     
     try:
         location_lower = location_name.lower()
@@ -843,200 +1557,141 @@ async def get_location_details(location_name: str, page: int = 1, page_size: int
             "total_pages": 0
         }
         
-        # Search in states data
-        states_path = DATA_DIR / "states"
-        if states_path.exists():
-            for state_file in states_path.glob("*.geojson"):
-                try:
-                    with open(state_file, 'r') as f:
-                        state_data = json.load(f)
-                    
-                    # Check if this is the state we're looking for
-                    state_name = state_data.get('properties', {}).get('name', '').lower()
-                    if location_lower in state_name or state_name in location_lower:
-                        # Extract all features
-                        if 'features' in state_data:
-                            for feature in state_data['features']:
-                                props = feature.get('properties', {})
-                                feature_type = props.get('type', 'unknown')
-                                
-                                if feature_type == 'district':
-                                    results['districts'].append({
-                                        'name': props.get('name'),
-                                        'code': props.get('code'),
-                                        'population': props.get('population'),
-                                        'area': props.get('area')
-                                    })
-                                elif feature_type == 'city':
-                                    results['cities'].append({
-                                        'name': props.get('name'),
-                                        'population': props.get('population'),
-                                        'tier': props.get('tier')
-                                    })
-                                elif feature_type == 'landmark':
-                                    results['landmarks'].append({
-                                        'name': props.get('name'),
-                                        'category': props.get('category'),
-                                        'importance': props.get('importance')
-                                    })
-                        
-                        # Get state center coordinates
-                        if state_data.get('geometry'):
-                            coords = state_data['geometry'].get('coordinates', [])
-                            if coords and len(coords) > 0:
-                                # Get first coordinate as approximate center
-                                first_coord = coords[0][0] if isinstance(coords[0][0], list) else coords[0]
-                                results['coordinates'] = {
-                                    'lat': first_coord[1] if len(first_coord) > 1 else 28.6139,
-                                    'lon': first_coord[0] if len(first_coord) > 0 else 77.2090
-                                }
-                        break
-                except Exception as e:
-                    logger.error(f"Error reading state file {state_file}: {e}")
-        
-        # Search in cities data
-        cities_path = DATA_DIR / "cities" / "indian_cities.geojson"
-        if cities_path.exists():
-            try:
-                with open(cities_path, 'r') as f:
-                    cities_data = json.load(f)
-                
-                for feature in cities_data.get('features', []):
-                    props = feature.get('properties', {})
-                    city_name = props.get('name', '').lower()
-                    
-                    if location_lower in city_name or city_name in location_lower:
-                        results['cities'].append({
-                            'name': props.get('name'),
-                            'state': props.get('state'),
-                            'population': props.get('population'),
-                            'tier': props.get('tier')
-                        })
-                        
-                        # Get city coordinates
-                        if feature.get('geometry'):
-                            coords = feature['geometry'].get('coordinates', [])
-                            if coords and len(coords) >= 2:
-                                results['coordinates'] = {
-                                    'lat': coords[1],
-                                    'lon': coords[0]
-                                }
-            except Exception as e:
-                logger.error(f"Error reading cities file: {e}")
-        
-        # Search in stations data
-        stations_path = DATA_DIR / "fullstations.json"
-        if stations_path.exists():
+        # Search in states data (prebuilt index: exact hit, then substring)
+        state_hit = _STATE_INDEX.get(location_lower) or next(
+            (entry for name, entry in _STATE_INDEX.items()
+             if location_lower in name or name in location_lower), None)
+        if state_hit is not None:
+            districts = state_hit['districts']
+            cities = list(state_hit['cities'])
+            landmarks = state_hit['landmarks']
+            if state_hit['coordinates']:
+                results['coordinates'] = state_hit['coordinates']
+        else:
+            districts = []
+            cities = []
+            landmarks = []
+
+        # Search in cities data (prebuilt entries)
+        for city_name, entry, coord in _CITY_ENTRIES:
+            if location_lower in city_name or city_name in location_lower:
+                cities.append(entry)
+                if coord:
+                    results['coordinates'] = coord
+
+        # Search in stations data: the counting pass keeps only record
+        # indices (no tuples or dicts), so off-page matches cost one int
+        # append each; everything else is deferred to the visible page
+        matched_stations = []
+        detail_records = ()
+        if _path_known(_FULLSTATIONS_PATH):
             try:
-                with open(stations_path, 'r') as f:
-                    stations_data = json.load(f)
-                
-                if 'zones' in stations_data:
-                    for zone_name, zone_data in stations_data['zones'].items():
-                        for feature in zone_data.get('features', []):
-                            props = feature.get('properties', {})
-                            station_name = props.get('name', '').lower()
-                            station_code = props.get('code', '').lower()
-                            
-                            # Check if station is in or near the location
-                            if location_lower in station_name or location_lower in station_code:
-                                results['stations'].append({
-                                    'name': props.get('name'),
-                                    'code': props.get('code'),
-                                    'zone': zone_name,
-                                    'lat': props.get('lat'),
-                                    'lon': props.get('lon'),
-                                    'importance': props.get('importance')
-                                })
+                idx = _station_index()
+                detail_records = idx['detail_records']
+                matched_stations = _match_stations(idx, location_lower)
             except Exception as e:
-                logger.error(f"Error reading stations file: {e}")
-        
-        # Calculate pagination
-        all_items = (results['stations'] + results['districts'] + 
-                     results['cities'] + results['landmarks'])
-        results['total_items'] = len(all_items)
-        results['total_pages'] = (results['total_items'] + page_size - 1) // page_size
-        
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        
-        paginated_stations = results['stations'][start_idx:end_idx]
-        remaining = page_size - len(paginated_stations)
-        start_idx = max(0, start_idx - len(results['stations']))
-        
-        paginated_districts = results['districts'][start_idx:start_idx + remaining] if remaining > 0 else []
-        remaining -= len(paginated_districts)
-        start_idx = max(0, start_idx - len(results['districts']))
-        
-        paginated_cities = results['cities'][start_idx:start_idx + remaining] if remaining > 0 else []
-        remaining -= len(paginated_cities)
-        start_idx = max(0, start_idx - len(results['cities']))
-        
-        paginated_landmarks = results['landmarks'][start_idx:start_idx + remaining] if remaining > 0 else []
-        
+                logger.error("Error reading stations file: %s", e)
+
+        # Pagination window, applied before any per-item dicts are built
+        total_items = len(matched_stations) + len(districts) + len(cities) + len(landmarks)
+        results['total_items'] = total_items
+        results['total_pages'] = -(-total_items // page_size)
+
+        # Clamp so page < 1 degrades to an empty-or-first window like the
+        # old list slicing did, instead of islice rejecting a negative index
+        start_idx = max((page - 1) * page_size, 0)
+        end_idx = max(start_idx + page_size, start_idx)
+
+        # One lazy pass over the concatenated categories yields exactly
+        # the visible window; the slice is then split back per category
+        # from the overlap of the window with each category's extent.
+        window = list(islice(
+            chain(matched_stations, districts, cities, landmarks),
+            start_idx, end_idx))
+
+        split = []
+        cum = 0
+        taken = 0
+        for length in (len(matched_stations), len(districts),
+                       len(cities), len(landmarks)):
+            in_window = max(min(end_idx, cum + length) - max(start_idx, cum), 0)
+            split.append(window[taken:taken + in_window])
+            taken += in_window
+            cum += length
+        station_page, results['districts'], results['cities'], results['landmarks'] = split
+
+        results['stations'] = [detail_records[i] for i in station_page]
+
         # Set default coordinates if not found (Delhi center)
         if not results['coordinates']:
             results['coordinates'] = {'lat': 28.6139, 'lon': 77.2090}
-        
-        results['stations'] = paginated_stations
-        results['districts'] = paginated_districts
-        results['cities'] = paginated_cities
-        results['landmarks'] = paginated_landmarks
-        
-        logger.info(f"✅ [Location Details] Found {results['total_items']} items, returning page {page}/{results['total_pages']}")
+
+        logger.info("✅ [Location Details] Found %d items, returning page %s/%s", results['total_items'], page, results['total_pages'])
         return results
         
     except Exception as e:
-        logger.error(f"❌ [Location Details] Error: {e}")
+        logger.error("❌ [Location Details] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/location/{location_name}")
-async def get_location_sample(location_name: str, page: int = 1, page_size: int = 50):
+def get_location_sample(location_name: str, page: int = 1, page_size: int = 50):
     """Get location details with real data from fullstations.json"""
     location_lower = location_name.lower()
-    logger.info(f"📍 [Location] Searching for: {location_name}")
+    logger.info("📍 [Location] Searching for: %s", location_name)
     
     try:
-        # Load fullstations.json
-        fullstations_path = DATA_DIR / "fullstations.json"
-        with open(fullstations_path, 'r', encoding='utf-8') as f:
-            stations_data = json.load(f)
-        
-        # Search for matching stations across all zones
-        matching_stations = []
-        location_coords = None
-        
-        for zone_name, zone_data in stations_data.get("zones", {}).items():
-            features = zone_data.get("features", [])
-            for feature in features:
-                props = feature.get("properties", {})
-                name = props.get("name", "").lower()
-                code = props.get("code", "").lower()
-                
-                # Match if location name is in station name or code
-                if location_lower in name or location_lower == code:
-                    coords = feature.get("geometry", {}).get("coordinates", [])
-                    if coords and len(coords) >= 2:
-                        station_info = {
-                            "type": "Station",
-                            "name": props.get("name", "Unknown"),
-                            "code": props.get("code", "N/A"),
-                            "category": props.get("category", "N/A"),
-                            "zone": zone_name,
-                            "zone_code": zone_data.get("zone_code", "N/A"),
-                            "latitude": coords[1],
-                            "longitude": coords[0]
-                        }
-                        matching_stations.append(station_info)
-                        
-                        # Use first match for coordinates
-                        if not location_coords:
-                            location_coords = {"lat": coords[1], "lon": coords[0]}
+        # Mask-then-materialize: one tight pass collects the matching
+        # indices (match on name or exact code, with usable coordinates),
+        # then response dicts are built for the hits only.
+        idx = _station_index()
+
+        # Bound worst-case work: a one-character query matches nearly
+        # every station, so serve the precomputed top-importance page
+        # instead of scanning and paginating the whole corpus
+        if len(location_lower) < 2:
+            top = idx['top_stations'][:page_size]
+            logger.info("⚡ Broad query %r: serving top %d stations by importance",
+                        location_name, len(top))
+            first = top[0] if top else None
+            return {
+                "location": location_name.title(),
+                "coordinates": ({"lat": first["latitude"], "lon": first["longitude"]}
+                                if first else {"lat": 20.5937, "lon": 78.9629}),
+                "data": top,
+                "total_items": len(top),
+                "page": 1,
+                "page_size": page_size,
+                "total_pages": 1
+            }
+
+        sample_records = idx['sample_records']
+        hits = [
+            i for i in _match_stations(idx, location_lower, exact_code=True)
+            if sample_records[i] is not None
+        ]
+
+        # Fuzzy fallback so a typo'd query still finds its station
+        if not hits:
+            hits = [
+                i for i in _fuzzy_station_hits(idx, location_lower, page_size)
+                if sample_records[i] is not None
+            ]
+            if hits:
+                logger.info("🔎 Fuzzy matched %d stations for: %s",
+                            len(hits), location_name)
+
+        matching_stations = [sample_records[i] for i in hits]
+
+        # Exact name/code queries resolve coordinates with a dict lookup;
+        # substring queries keep using the first match
+        location_coords = idx['coord_by_key'].get(location_lower)
+        if location_coords is None and hits:
+            first = matching_stations[0]
+            location_coords = {"lat": first["latitude"], "lon": first["longitude"]}
         
         # If no matches found, return error
         if not matching_stations:
-            logger.warning(f"⚠️ No stations found for: {location_name}")
+            logger.warning("⚠️ No stations found for: %s", location_name)
             return {
                 "location": location_name.title(),
                 "coordinates": {"lat": 20.5937, "lon": 78.9629},  # Center of India
@@ -1047,7 +1702,7 @@ async def get_location_sample(location_name: str, page: int = 1, page_size: int
                 "total_pages": 1
             }
         
-        logger.info(f"✅ Found {len(matching_stations)} matching stations for: {location_name}")
+        logger.info("✅ Found %d matching stations for: %s", len(matching_stations), location_name)
         
         # Return matching stations as flat list for table
         return {
@@ -1061,73 +1716,33 @@ async def get_location_sample(location_name: str, page: int = 1, page_size: int
         }
         
     except FileNotFoundError:
-        logger.error(f"❌ fullstations.json not found at {DATA_DIR}")
+        logger.error("❌ fullstations.json not found at %s", DATA_DIR)
         raise HTTPException(status_code=500, detail="Station data file not found")
     except Exception as e:
-        logger.error(f"❌ Error loading location data: {str(e)}")
+        logger.error("❌ Error loading location data: %s", e)
         raise HTTPException(status_code=500, detail=f"Error loading location data: {str(e)}")
 
-# Alias endpoint without dash for convenience
-@app.get("/api/location/{location_name}")
-async def get_location(location_name: str, page: int = 1, page_size: int = 50):
-    """Alias for get_location_details - same functionality"""
-    return await get_location_details(location_name, page, page_size)
-
 
 # LOD Endpoint - added for zoom-based progressive loading
 @app.get("/api/stations/level/{level}")
-async def get_stations_by_level(level: int):
+def get_stations_by_level(request: Request, level: int):
     """Get stations by LOD level: 0=HQ, 1=A1, 2=A1+A, 3=all"""
-    logger.info(f"�� [LOD] GET /api/stations/level/{level}")
+    logger.info("�� [LOD] GET /api/stations/level/%s", level)
     
     try:
-        if level not in [0, 1, 2, 3]:
+        if not (0 <= level <= 3):
             raise HTTPException(status_code=400, detail=f"Invalid level: {level}")
         
-        full_path = DATA_DIR / "fullstations.json"
-        if not full_path.exists():
+        if not _path_known(_FULLSTATIONS_PATH):
             raise HTTPException(status_code=404, detail="fullstations.json not found")
-        
-        with open(full_path, 'r') as f:
-            data = json.load(f)
-        
-        all_stations = []
-        if 'zones' in data:
-            for zone_name, zone_data in data['zones'].items():
-                zone_code = zone_data.get('zone_code', 'UK')
-                for feat in zone_data.get('features', []):
-                    props = feat['properties']
-                    coords = feat['geometry']['coordinates']
-                    category = props.get('category', 'B')
-                    importance = {'A1': 5, 'A': 4, 'B': 3, 'C': 2, 'D': 1}.get(category, 3)
-                    all_stations.append({
-                        "name": props.get('name', ''),
-                        "code": props.get('code', ''),
-                        "lat": coords[1],
-                        "lon": coords[0],
-                        "zone": zone_code,
-                        "category": category,
-                        "importance": importance
-                    })
-        
-        logger.info(f"📊 [LOD] Loaded {len(all_stations)} total stations")
-        
-        headquarters = {'NDLS', 'HWH', 'BCT', 'MAS', 'CSMT'}
-        if level == 0:
-            filtered = [s for s in all_stations if s['code'] in headquarters]
-        elif level == 1:
-            filtered = [s for s in all_stations if s['importance'] >= 5]
-        elif level == 2:
-            filtered = [s for s in all_stations if s['importance'] >= 4]
-        else:
-            filtered = all_stations
-        
-        logger.info(f"✅ [LOD] Level {level}: Returning {len(filtered)} stations")
-        return {"stations": filtered, "level": level, "total": len(filtered)}
+
+        body, etag = _lod_response_bytes(level)
+        logger.info("✅ [LOD] Level %s: serving %d cached bytes", level, len(body))
+        return _etag_json_response(request, body, etag)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"❌ [LOD] Error: {e}")
+        logger.error("❌ [LOD] Error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":